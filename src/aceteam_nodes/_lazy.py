@@ -0,0 +1,35 @@
+"""PEP 562 lazy exports for package ``__init__`` modules."""
+
+import importlib
+import sys
+from collections.abc import Callable, Mapping
+from typing import Any
+
+
+def lazy_exports(
+    package: str,
+    imports: Mapping[str, tuple[str, str]],
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """
+    Build the ``(__getattr__, __dir__)`` pair for ``package``, where ``imports``
+    maps each public name to the (relative module, attribute) that provides it.
+
+    A name's module is imported on first access and the value cached on the
+    package, so later lookups never reach ``__getattr__`` again.
+    """
+
+    def __getattr__(name: str) -> Any:
+        try:
+            module_name, attr = imports[name]
+        except KeyError:
+            raise AttributeError(
+                f"module {package!r} has no attribute {name!r}"
+            ) from None
+        value = getattr(importlib.import_module(module_name, package), attr)
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted({*vars(sys.modules[package]), *imports})
+
+    return __getattr__, __dir__
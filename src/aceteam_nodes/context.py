@@ -1,12 +1,11 @@
 """CLI execution context extending workflow-engine's LocalContext."""
 
+import copy
 import sys
 from collections.abc import Mapping
 from pathlib import Path
-from typing import Any
+from typing import Any, override
 
-import yaml
-from overrides import override
 from workflow_engine import (
     Data,
     DataMapping,
@@ -18,6 +17,11 @@ from workflow_engine import (
 from workflow_engine.contexts import LocalContext
 from workflow_engine.core import ValidatedWorkflow
 
+# Parsed config files keyed by expanded path, tagged with the (mtime, size) they
+# were read at so repeated CLIContext constructions skip re-parsing until the
+# file changes.
+_CONFIG_CACHE: dict[Path, tuple[tuple[int, int], dict[str, Any]]] = {}
+
 
 class CLIContext(LocalContext):
     """
@@ -40,10 +44,23 @@ class CLIContext(LocalContext):
     @staticmethod
     def _load_config(config_path: str) -> dict[str, Any]:
         path = Path(config_path).expanduser()
-        if not path.exists():
+        try:
+            stat = path.stat()
+        except (FileNotFoundError, NotADirectoryError):
             return {}
-        with open(path) as f:
-            return yaml.safe_load(f) or {}
+        version = (stat.st_mtime_ns, stat.st_size)
+        cached = _CONFIG_CACHE.get(path)
+        if cached is None or cached[0] != version:
+            # Imported here so runs without a config file never pay for PyYAML.
+            import yaml
+
+            # libyaml's C loader when PyYAML was built with it; same safe subset.
+            loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+            with open(path) as f:
+                cached = (version, yaml.load(f, Loader=loader) or {})
+            _CONFIG_CACHE[path] = cached
+        # Copy so one context's edits to its config never leak into another's.
+        return copy.deepcopy(cached[1])
 
     def _resolve_api_key(self, model: str) -> str:
         """Resolve API key from config or environment based on model name."""
@@ -1,13 +1,17 @@
 """API Call node - HTTP requests with Jinja templating."""
 
+import asyncio
 import json
 import logging
-from functools import cached_property
+import weakref
+from collections.abc import AsyncGenerator
+from functools import cached_property, lru_cache
+from http.cookiejar import CookieJar, DefaultCookiePolicy
 from json import JSONDecodeError
-from typing import Any, ClassVar, Type
+from typing import Any, ClassVar, Type, override
 
 import httpx
-from overrides import override
+from jinja2 import Template
 from pydantic import Field
 from workflow_engine import (
     Data,
@@ -22,16 +26,80 @@ from workflow_engine import (
     StringMapValue,
     StringValue,
     ValidationContext,
-    Value,
     WorkflowException,
 )
 from workflow_engine.core import StakeholderLevel
 from workflow_engine.files import JSONFileValue, JSONLinesFileValue, TextFileValue
 
-from ..utils import format_jinja
+from ..utils import compile_jinja, is_static_jinja
 
 logger = logging.getLogger(__name__)
 
+# Parameter values whose template value has to be read from storage.
+_FILE_VALUE_TYPES = (JSONFileValue, JSONLinesFileValue, TextFileValue)
+
+
+# One pooled client per event loop, so back-to-back calls (e.g. inside a ForEach)
+# reuse keep-alive connections and TLS sessions instead of handshaking per call.
+# httpx connections are bound to the loop that opened them, hence the loop key.
+# Open connections reference the loop, so an entry is only ever dropped by the
+# generator stored next to its client (see _close_with_loop).
+_CLIENTS = weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop,
+    tuple[httpx.AsyncClient, AsyncGenerator[None, None]],
+]()
+
+# Each call used to open its own client, so nothing capped concurrent requests;
+# the shared client keeps it that way rather than queueing a wide ForEach behind
+# httpx's default of 100 connections. Only the idle keep-alive pool is bounded.
+_LIMITS = httpx.Limits(max_connections=None, max_keepalive_connections=20)
+
+
+async def _close_with_loop(
+    loop: asyncio.AbstractEventLoop, client: httpx.AsyncClient
+) -> AsyncGenerator[None, None]:
+    """Close ``client`` when ``loop`` shuts down.
+
+    ``asyncio.run()`` finalizes every started async generator
+    (``loop.shutdown_asyncgens()``) before closing its loop; that is the only
+    shutdown hook a library gets on a loop it does not own.
+    """
+    try:
+        yield
+    finally:
+        entry = _CLIENTS.get(loop)
+        if entry is not None and entry[0] is client:
+            del _CLIENTS[loop]
+        await client.aclose()
+
+
+async def _shared_client() -> httpx.AsyncClient:
+    loop = asyncio.get_running_loop()
+    entry = _CLIENTS.get(loop)
+    if entry is not None and not entry[0].is_closed:
+        return entry[0]
+    # The client is shared by unrelated nodes (and possibly users), so it must
+    # never store a Set-Cookie from one response and replay it on the next
+    # request: the jar's policy rejects every cookie.
+    cookies = CookieJar(policy=DefaultCookiePolicy(allowed_domains=[]))
+    client = httpx.AsyncClient(cookies=cookies, limits=_LIMITS)
+    lifetime = _close_with_loop(loop, client)
+    _CLIENTS[loop] = (client, lifetime)
+    # Starting the generator is what registers it for the loop's shutdown.
+    await anext(lifetime)
+    return client
+
+
+@lru_cache(maxsize=256)
+def _build_input_type(parameters_json: str) -> Type[Data]:
+    """Build the input Data class for a serialized ``parameters`` schema.
+
+    ``build_data_cls`` runs pydantic's ``create_model``, so nodes sharing a
+    parameters schema (e.g. many APICall nodes from one template) share one class.
+    """
+    parameters = FieldSchemaMappingValue.model_validate_json(parameters_json)
+    return parameters.to_data_schema("APICallInput").build_data_cls()
+
 
 class APICallParams(Params):
     url: StringValue = Field(
@@ -108,13 +176,17 @@ class APICallNode(
         content_type = self.params.headers.get("Accept")
         return content_type is not None and "application/json" in content_type
 
+    @cached_property
+    def _sets_content_type(self) -> bool:
+        """Whether the configured headers already include a Content-Type."""
+        return any(key.lower() == "content-type" for key in self.params.headers.keys())
+
     @override
     async def dynamic_input_type(
         self,
         context: ValidationContext,
     ) -> Type[Data]:
-        schema = self.params.parameters.to_data_schema("APICallInput")
-        return schema.build_data_cls()
+        return _build_input_type(self.params.parameters.model_dump_json())
 
     @classmethod
     @override
@@ -122,10 +194,11 @@ class APICallNode(
         return APICallOutput
 
     async def _expand_parameter_value(
-        self, context: ExecutionContext, value: Value
+        self,
+        context: ExecutionContext,
+        value: JSONFileValue | JSONLinesFileValue | TextFileValue,
     ) -> Any:
-        """Expand data files into their content for templating."""
-        assert isinstance(value, Value)
+        """Read a data file parameter into its content for templating."""
         if isinstance(value, JSONFileValue):
             try:
                 return await value.read_data(context)
@@ -142,7 +215,7 @@ class APICallNode(
                     f"Failed to read JSON lines file '{value.path}'.",
                     level=StakeholderLevel.USER,
                 ) from e
-        elif isinstance(value, TextFileValue):
+        else:
             try:
                 return await value.read_text(context)
             except Exception as e:
@@ -150,42 +223,124 @@ class APICallNode(
                     f"Failed to read text file '{value.path}'.",
                     level=StakeholderLevel.USER,
                 ) from e
-        return value.root
+
+    def _compile_template(self, template: str, *, label: str) -> Template:
+        try:
+            return compile_jinja(template)
+        except Exception as e:
+            raise WorkflowException(
+                f"Failed to format {label}: {e}",
+                level=StakeholderLevel.USER,
+            ) from e
+
+    @cached_property
+    def _url_template(self) -> Template | str:
+        """The compiled URL template, or the rendered URL when it is static."""
+        template = self._compile_template(self.params.url.root, label="URL template")
+        if is_static_jinja(self.params.url.root):
+            return self._render_template(template, {}, label="URL template")
+        return template
+
+    @cached_property
+    def _body_template(self) -> Template | None:
+        """The compiled request body template, or None when the body is blank."""
+        body_template = self.params.body_template.root
+        if not body_template.strip():
+            return None
+        return self._compile_template(body_template, label="request body template")
+
+    @cached_property
+    def _static_request_body(self) -> tuple[str | bytes | None, bool] | None:
+        """
+        (content, is_json) when the request body does not depend on the input,
+        or None when it has to be rendered per run.
+
+        A template without Jinja markup is still rendered once (Jinja trims a
+        trailing newline), but then parsed once instead of on every call. JSON
+        bodies are kept pre-encoded, exactly as httpx would encode ``json=``.
+        """
+        if self._body_template is None:
+            return None, False
+        if not is_static_jinja(self.params.body_template.root):
+            return None
+        body_text = self._render_template(
+            self._body_template, {}, label="request body template"
+        )
+        request_body = self._parse_request_body(body_text)
+        if isinstance(request_body, (dict, list)):
+            try:
+                encoded = json.dumps(
+                    request_body,
+                    ensure_ascii=False,
+                    separators=(",", ":"),
+                    allow_nan=False,
+                )
+            except ValueError as e:
+                raise WorkflowException(
+                    f"Failed to encode request body as JSON: {e}",
+                    level=StakeholderLevel.USER,
+                ) from e
+            return encoded.encode("utf-8"), True
+        return request_body, False
+
+    @cached_property
+    def _header_templates(self) -> tuple[tuple[str, str, Template | str], ...]:
+        """
+        (name, error label, value) for each configured header, where the value is
+        a compiled template, or the already-rendered string when it is static.
+        """
+        templates: list[tuple[str, str, Template | str]] = []
+        for key, value in self.params.headers.items():
+            label = f"header {key!r}"
+            template = self._compile_template(value.root, label=label)
+            if is_static_jinja(value.root):
+                templates.append(
+                    (key, label, self._render_template(template, {}, label=label))
+                )
+            else:
+                templates.append((key, label, template))
+        return tuple(templates)
 
     def _render_template(
         self,
-        template: str,
+        template: Template,
         parameters: dict[str, Any],
         *,
         label: str,
     ) -> str:
         try:
-            return format_jinja(template, parameters)
+            return template.render(**parameters)
         except Exception as e:
             raise WorkflowException(
                 f"Failed to format {label}: {e}",
                 level=StakeholderLevel.USER,
             ) from e
 
+    def _parse_request_body(self, body_text: str) -> Any:
+        """Send JSON-looking bodies as JSON, anything else as raw content."""
+        if body_text.strip().startswith(("{", "[")):
+            try:
+                return json.loads(body_text)
+            except JSONDecodeError:
+                pass
+        return body_text
+
     def _is_json_response(self, response: httpx.Response) -> bool:
-        content_type = response.headers.get("content-type", "")
-        assert isinstance(content_type, str)
+        content_type = response.headers.get("content-type")
+        if not content_type:
+            return False
         content_type = content_type.lower()
         return "application/json" in content_type or "text/json" in content_type
 
     def _parse_response_data(self, response: httpx.Response) -> Any:
+        if not self._is_json_response(response):
+            return response.text
         try:
-            if self._is_json_response(response):
-                return response.json()
-            else:
-                return response.text
-        except JSONDecodeError:
-            try:
-                return response.text
-            except Exception:
-                return str(response.content)
-        except Exception:
-            return str(response.content)
+            return response.json()
+        except (ValueError, RecursionError):
+            # ValueError covers JSONDecodeError and UnicodeDecodeError; the
+            # json module raises RecursionError on deeply nested arrays.
+            return response.text
 
     @override
     async def run(
@@ -199,54 +354,62 @@ class APICallNode(
         # Prepare template parameters from runtime input (field names come from
         # params.parameters schemas — same pattern as JinjaNode).
         parameters: dict[str, Any] = {}
-        if len(self.params.parameters) > 0:
-            for name in self.params.parameters.keys():
-                if hasattr(input, name):
-                    parameters[name] = await self._expand_parameter_value(
-                        context, getattr(input, name)
-                    )
-                else:
-                    raise WorkflowException(
-                        f"Parameter {name} is not set.",
-                        level=StakeholderLevel.USER,
-                    )
+        file_values: dict[str, JSONFileValue | JSONLinesFileValue | TextFileValue] = {}
+        for name in self.params.parameters.keys():
+            if not hasattr(input, name):
+                raise WorkflowException(
+                    f"Parameter {name} is not set.",
+                    level=StakeholderLevel.USER,
+                )
+            value = getattr(input, name)
+            if isinstance(value, _FILE_VALUE_TYPES):
+                file_values[name] = value
+            else:
+                parameters[name] = value.root
+        # Only file-backed values need awaiting; read them concurrently.
+        if file_values:
+            contents = await asyncio.gather(
+                *(
+                    self._expand_parameter_value(context, value)
+                    for value in file_values.values()
+                )
+            )
+            parameters.update(zip(file_values, contents, strict=True))
 
         # Format URL with Jinja templating
-        url = self._render_template(
-            self.params.url.root,
-            parameters,
-            label="URL template",
-        )
+        url_template = self._url_template
+        if isinstance(url_template, str):
+            url = url_template
+        else:
+            url = self._render_template(url_template, parameters, label="URL template")
 
         # Format request body with Jinja templating
-        request_body = None
-        body_template = self.params.body_template.root
-        if body_template.strip():
+        static_body = self._static_request_body
+        request_body: Any
+        if static_body is not None:
+            request_body, is_json = static_body
+        else:
+            assert self._body_template is not None
             body_text = self._render_template(
-                body_template,
+                self._body_template,
                 parameters,
                 label="request body template",
             )
-            if body_text.strip().startswith(("{", "[")):
-                try:
-                    request_body = json.loads(body_text)
-                except JSONDecodeError:
-                    request_body = body_text
-            else:
-                request_body = body_text
+            request_body = self._parse_request_body(body_text)
+            is_json = isinstance(request_body, (dict, list))
 
         # Prepare headers (values are Jinja-templated; names are fixed)
-        headers: dict[str, str] = {}
-        for key, value in self.params.headers.items():
-            headers[key] = self._render_template(
-                value.root,
-                parameters,
-                label=f"header {key!r}",
+        headers: dict[str, str] = {
+            key: (
+                template
+                if isinstance(template, str)
+                else self._render_template(template, parameters, label=label)
             )
+            for key, label, template in self._header_templates
+        }
 
-        if request_body is not None and isinstance(request_body, (dict, list)):
-            if "content-type" not in {k.lower() for k in headers.keys()}:
-                headers["Content-Type"] = "application/json"
+        if is_json and not self._sets_content_type:
+            headers["Content-Type"] = "application/json"
 
         logger.info(f"Making {self.params.method} request to: {url}")
 
@@ -254,25 +417,27 @@ class APICallNode(
         timeout = float(self.params.timeout.root)
         method = self.params.method.root
         try:
-            async with httpx.AsyncClient(timeout=timeout) as client:
-                if isinstance(request_body, (dict, list)):
-                    response = await client.request(
-                        method=method,
-                        url=url,
-                        headers=headers,
-                        json=request_body,
-                    )
-                elif request_body is not None:
-                    response = await client.request(
-                        method=method,
-                        url=url,
-                        headers=headers,
-                        content=request_body,
-                    )
-                else:
-                    response = await client.request(
-                        method=method, url=url, headers=headers
-                    )
+            client = await _shared_client()
+            if isinstance(request_body, (dict, list)):
+                response = await client.request(
+                    method=method,
+                    url=url,
+                    headers=headers,
+                    json=request_body,
+                    timeout=timeout,
+                )
+            elif request_body is not None:
+                response = await client.request(
+                    method=method,
+                    url=url,
+                    headers=headers,
+                    content=request_body,
+                    timeout=timeout,
+                )
+            else:
+                response = await client.request(
+                    method=method, url=url, headers=headers, timeout=timeout
+                )
         except httpx.TimeoutException as e:
             raise WorkflowException(
                 f"Request timed out after {timeout} seconds.",
@@ -292,8 +457,10 @@ class APICallNode(
         # Parse response
         status_code = IntegerValue(response.status_code)
         response_data = self._parse_response_data(response)
-        response_headers = StringMapValue[StringValue](
-            {k: StringValue(v) for k, v in response.headers.items()}
+        # Let pydantic-core wrap the raw str values in one pass rather than
+        # constructing a StringValue per header in Python.
+        response_headers = StringMapValue[StringValue].model_validate(
+            dict(response.headers.items())
         )
 
         return output_type(
@@ -4,10 +4,9 @@ import asyncio
 import logging
 import time
 from contextlib import contextmanager
-from typing import TYPE_CHECKING, Callable, ClassVar, Iterator, Type
+from typing import TYPE_CHECKING, Callable, ClassVar, Iterator, Type, override
 from urllib.parse import urlparse
 
-from overrides import override
 from pydantic import Field
 from workflow_engine import (
     Data,
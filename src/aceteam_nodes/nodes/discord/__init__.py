@@ -1,10 +1,31 @@
-"""Discord workflow nodes."""
+"""Discord workflow nodes.
+
+Names are resolved lazily (PEP 562): each entry point imports only its own
+node module, not every sibling node in this package.
+"""
+
+from typing import TYPE_CHECKING
+
+from ..._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .bot_info import DiscordBotInfoNode
+    from .common import DISCORD_TOKEN_ENV_VAR
+    from .list_channels import DiscordListChannelsNode
+    from .read_messages import DiscordReadMessagesNode
+    from .send import DiscordSendMessageNode
+
+_LAZY_IMPORTS: dict[str, tuple[str, str]] = {
+    "DISCORD_TOKEN_ENV_VAR": (".common", "DISCORD_TOKEN_ENV_VAR"),
+    "DiscordBotInfoNode": (".bot_info", "DiscordBotInfoNode"),
+    "DiscordListChannelsNode": (".list_channels", "DiscordListChannelsNode"),
+    "DiscordReadMessagesNode": (".read_messages", "DiscordReadMessagesNode"),
+    "DiscordSendMessageNode": (".send", "DiscordSendMessageNode"),
+}
+
+
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY_IMPORTS)
 
-from .bot_info import DiscordBotInfoNode
-from .common import DISCORD_TOKEN_ENV_VAR
-from .list_channels import DiscordListChannelsNode
-from .read_messages import DiscordReadMessagesNode
-from .send import DiscordSendMessageNode
 
 __all__ = (
     "DISCORD_TOKEN_ENV_VAR",
@@ -1,9 +1,8 @@
 """Discord List Channels node - enumerates channels in a guild."""
 
-from typing import ClassVar, Type
+from typing import ClassVar, Type, override
 
 from discord.errors import DiscordException, HTTPException
-from overrides import override
 from pydantic import Field
 from workflow_engine import (
     Data,
@@ -1,10 +1,9 @@
 """Discord Read Messages node - fetches recent messages from a channel."""
 
-from typing import ClassVar, Type
+from typing import ClassVar, Type, override
 
 import discord
 from discord.errors import DiscordException, HTTPException
-from overrides import override
 from pydantic import Field
 from workflow_engine import (
     Data,
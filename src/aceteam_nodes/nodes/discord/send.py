@@ -4,11 +4,10 @@ The bot token is resolved at runtime via ``context.get_env``.
 """
 
 import logging
-from typing import ClassVar, Type
+from typing import ClassVar, Type, override
 
 import discord
 from discord.errors import DiscordException, HTTPException
-from overrides import override
 from pydantic import Field
 from workflow_engine import (
     Data,
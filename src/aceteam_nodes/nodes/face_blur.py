@@ -22,9 +22,8 @@ from __future__ import annotations
 import io
 import logging
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any, ClassVar, Type
+from typing import TYPE_CHECKING, Any, ClassVar, Type, override
 
-from overrides import override
 from pydantic import Field
 from workflow_engine import (
     Data,
@@ -1,8 +1,7 @@
 """LLM node - AI text generation via aceteam-aep."""
 
-from typing import ClassVar, Type
+from typing import ClassVar, Type, override
 
-from overrides import override
 from pydantic import Field
 from workflow_engine import (
     Data,
@@ -13,10 +13,9 @@ are passed into the command via Jinja substitution from the node's input.
 
 import asyncio
 import os
-from typing import ClassVar, Type
+from typing import ClassVar, Type, override
 
 from jinja2 import StrictUndefined, Template
-from overrides import override
 from pydantic import Field
 from workflow_engine import (
     BooleanValue,
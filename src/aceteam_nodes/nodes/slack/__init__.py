@@ -1,10 +1,32 @@
-"""Slack workflow nodes."""
+"""Slack workflow nodes.
+
+Names are resolved lazily (PEP 562): each entry point imports only its own
+node module, not every sibling node in this package.
+"""
+
+from typing import TYPE_CHECKING
+
+from ..._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .common import SLACK_BOT_TOKEN_ENV_VAR, SLACK_USER_TOKEN_ENV_VAR
+    from .list_channels import SlackListChannelsNode
+    from .read_messages import SlackReadMessagesNode
+    from .search_messages import SlackSearchMessagesNode
+    from .send import SlackSendMessageNode
+
+_LAZY_IMPORTS: dict[str, tuple[str, str]] = {
+    "SLACK_BOT_TOKEN_ENV_VAR": (".common", "SLACK_BOT_TOKEN_ENV_VAR"),
+    "SLACK_USER_TOKEN_ENV_VAR": (".common", "SLACK_USER_TOKEN_ENV_VAR"),
+    "SlackListChannelsNode": (".list_channels", "SlackListChannelsNode"),
+    "SlackReadMessagesNode": (".read_messages", "SlackReadMessagesNode"),
+    "SlackSearchMessagesNode": (".search_messages", "SlackSearchMessagesNode"),
+    "SlackSendMessageNode": (".send", "SlackSendMessageNode"),
+}
+
+
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY_IMPORTS)
 
-from .common import SLACK_BOT_TOKEN_ENV_VAR, SLACK_USER_TOKEN_ENV_VAR
-from .list_channels import SlackListChannelsNode
-from .read_messages import SlackReadMessagesNode
-from .search_messages import SlackSearchMessagesNode
-from .send import SlackSendMessageNode
 
 __all__ = (
     "SLACK_BOT_TOKEN_ENV_VAR",
@@ -1,8 +1,7 @@
 """Slack Read Messages node - fetches channel history via ``conversations.history``."""
 
-from typing import Any, ClassVar, Type
+from typing import Any, ClassVar, Type, override
 
-from overrides import override
 from pydantic import Field
 from slack_sdk.errors import SlackApiError, SlackClientError
 from slack_sdk.web.async_client import AsyncWebClient
@@ -1,8 +1,7 @@
 """Slack Search Messages node - searches workspace messages via ``search.messages``."""
 
-from typing import ClassVar, Type
+from typing import ClassVar, Type, override
 
-from overrides import override
 from pydantic import Field
 from slack_sdk.errors import SlackApiError, SlackClientError
 from slack_sdk.web.async_client import AsyncWebClient
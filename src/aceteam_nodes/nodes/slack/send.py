@@ -1,8 +1,7 @@
 """Slack Send Message node - posts a message via the Slack Web API."""
 
-from typing import ClassVar, Type
+from typing import ClassVar, Type, override
 
-from overrides import override
 from pydantic import Field
 from slack_sdk.errors import SlackApiError, SlackClientError
 from slack_sdk.web.async_client import AsyncWebClient
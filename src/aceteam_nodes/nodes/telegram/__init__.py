@@ -1,10 +1,31 @@
-"""Telegram workflow nodes."""
+"""Telegram workflow nodes.
+
+Names are resolved lazily (PEP 562): each entry point imports only its own
+node module, not every sibling node in this package.
+"""
+
+from typing import TYPE_CHECKING
+
+from ..._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .bot_info import TelegramBotInfoNode
+    from .common import TELEGRAM_TOKEN_ENV_VAR
+    from .list_chats import TelegramListChatsNode
+    from .read_messages import TelegramReadMessagesNode
+    from .send import TelegramSendMessageNode
+
+_LAZY_IMPORTS: dict[str, tuple[str, str]] = {
+    "TELEGRAM_TOKEN_ENV_VAR": (".common", "TELEGRAM_TOKEN_ENV_VAR"),
+    "TelegramBotInfoNode": (".bot_info", "TelegramBotInfoNode"),
+    "TelegramListChatsNode": (".list_chats", "TelegramListChatsNode"),
+    "TelegramReadMessagesNode": (".read_messages", "TelegramReadMessagesNode"),
+    "TelegramSendMessageNode": (".send", "TelegramSendMessageNode"),
+}
+
+
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY_IMPORTS)
 
-from .bot_info import TelegramBotInfoNode
-from .common import TELEGRAM_TOKEN_ENV_VAR
-from .list_chats import TelegramListChatsNode
-from .read_messages import TelegramReadMessagesNode
-from .send import TelegramSendMessageNode
 
 __all__ = (
     "TELEGRAM_TOKEN_ENV_VAR",
@@ -1,8 +1,7 @@
 """Telegram Bot Info node - returns the authenticated bot's identity."""
 
-from typing import ClassVar, Type
+from typing import ClassVar, Type, override
 
-from overrides import override
 from pydantic import Field
 from telegram import Bot
 from telegram.error import TelegramError
@@ -1,8 +1,7 @@
 """Telegram List Chats node - looks up metadata for a single chat via ``getChat``."""
 
-from typing import ClassVar, Type
+from typing import ClassVar, Type, override
 
-from overrides import override
 from pydantic import Field
 from telegram import Bot
 from telegram.error import TelegramError
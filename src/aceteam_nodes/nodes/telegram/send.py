@@ -1,9 +1,8 @@
 """Telegram Send Message node - sends a message via the Telegram Bot API."""
 
 import logging
-from typing import ClassVar, Type
+from typing import ClassVar, Type, override
 
-from overrides import override
 from pydantic import Field
 from telegram import Bot
 from telegram.error import TelegramError
@@ -1,9 +1,8 @@
 """XPath Extract node - extract a sequence of texts from an HTML document."""
 
-from typing import ClassVar, Type
+from typing import ClassVar, Type, override
 
 from lxml import html as lxml_html
-from overrides import override
 from pydantic import Field
 from workflow_engine import (
     Data,
@@ -109,17 +108,20 @@ class XPathExtractNode(
             # XPath expressions like `count(...)` return a scalar; coerce to single-item list.
             matches = [matches]
 
-        results: list[StringValue] = []
+        texts: list[str] = []
         for m in matches:
             if isinstance(m, str):
-                text = m
+                texts.append(m)
             elif hasattr(m, "text_content"):
-                text = m.text_content()
+                texts.append(m.text_content())
             else:
-                text = str(m)
-            results.append(StringValue(text))
+                texts.append(str(m))
 
-        return XPathExtractOutput(results=SequenceValue[StringValue](results))
+        # Let pydantic-core wrap the raw str values in one pass rather than
+        # constructing a StringValue per match in Python.
+        return XPathExtractOutput(
+            results=SequenceValue[StringValue].model_validate(texts)
+        )
 
 
 __all__ = [
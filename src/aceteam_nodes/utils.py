@@ -2,9 +2,16 @@
 
 import re
 from collections.abc import Mapping
+from functools import lru_cache
 from typing import Any
 
-from jinja2 import BaseLoader, Environment, StrictUndefined, select_autoescape
+from jinja2 import (
+    BaseLoader,
+    Environment,
+    StrictUndefined,
+    Template,
+    select_autoescape,
+)
 from workflow_engine import (
     DataMapping,
     IntegerValue,
@@ -26,6 +33,16 @@ def optional_integer(value: int | None) -> IntegerValue | NullValue:
     return NullValue(None) if value is None else IntegerValue(value)
 
 
+@lru_cache(maxsize=128)
+def _variable_pattern(keys: frozenset[str]) -> re.Pattern[str]:
+    """Match any `{key}` placeholder, capturing the key."""
+    for key in keys:
+        assert "{" not in key and "}" not in key, (
+            f"Variable name must not contain curly braces: {key}"
+        )
+    return re.compile(r"\{(" + "|".join(map(re.escape, keys)) + r")\}")
+
+
 def format_string(
     text: str,
     variables: Mapping[str, str],
@@ -37,40 +54,67 @@ def format_string(
     if len(variables) == 0:
         return text
 
-    for key in variables.keys():
-        assert "{" not in key and "}" not in key, (
-            f"Variable name must not contain curly braces: {key}"
-        )
+    # Validates the variable names once per distinct key set.
+    pattern = _variable_pattern(frozenset(variables.keys()))
 
-    pattern = re.compile(
-        "|".join(re.escape("{" + key + "}") for key in variables.keys())
-    )
+    if "{" not in text:
+        return text
 
     for _ in range(iterations):
-        next_text = pattern.sub(lambda match: variables[match.group(0)[1:-1]], text)
-        if next_text == text:
+        text, count = pattern.subn(lambda match: variables[match.group(1)], text)
+        if count == 0:
             break
-        text = next_text
 
     return text
 
 
+# Environments are immutable once templates are compiled from them, so one
+# per escaping mode is shared rather than rebuilt for every template.
+_JINJA_ENVIRONMENTS = {
+    auto_escape: Environment(
+        loader=BaseLoader(),
+        autoescape=select_autoescape() if auto_escape else False,
+        undefined=StrictUndefined,
+    )
+    for auto_escape in (True, False)
+}
+
+
+@lru_cache(maxsize=256)
+def compile_jinja(template_string: str, auto_escape: bool = True) -> Template:
+    """
+    Compile a Jinja2 template string so it can be rendered repeatedly.
+
+    Compiled templates are cached by source, so hot templates are only parsed
+    once per process; rendering a shared Template is thread-safe.
+    """
+    return _JINJA_ENVIRONMENTS[auto_escape].from_string(template_string)
+
+
+def is_static_jinja(template_string: str) -> bool:
+    """Whether a template has no Jinja markup, so it renders the same every time."""
+    return not any(marker in template_string for marker in ("{{", "{%", "{#"))
+
+
 def format_jinja(
     template_string: str,
     variables: Mapping[str, Any] | None = None,
     auto_escape: bool = True,
 ) -> str:
     """Render a Jinja2 template string with the provided variables."""
+    # Jinja only rewrites plain text by normalising "\r" newlines and trimming a
+    # trailing newline, so text with neither renders to itself.
+    if (
+        is_static_jinja(template_string)
+        and "\r" not in template_string
+        and not template_string.endswith("\n")
+    ):
+        return template_string
+
     if variables is None:
         variables = {}
 
-    env = Environment(
-        loader=BaseLoader(),
-        autoescape=select_autoescape() if auto_escape else False,
-        undefined=StrictUndefined,
-    )
-
-    template = env.from_string(template_string)
+    template = compile_jinja(template_string, auto_escape=auto_escape)
     return template.render(**variables)
 
 
@@ -87,16 +131,22 @@ def build_data_mapping(
     return mapping
 
 
-def dump_data_mapping(mapping: DataMapping) -> Mapping[str, Any]:
-    return {name: value.model_dump() for name, value in mapping.items()}
+def dump_data_mapping(mapping: DataMapping) -> dict[str, Any]:
+    # Same output as value.model_dump(), minus its per-call argument handling.
+    return {
+        name: value.__pydantic_serializer__.to_python(value)
+        for name, value in mapping.items()
+    }
 
 
 __all__ = (
     "OptionalInteger",
     "OptionalString",
+    "compile_jinja",
     "dump_data_mapping",
     "format_jinja",
     "format_string",
+    "is_static_jinja",
     "optional_integer",
     "optional_string",
 )
@@ -1,29 +1,60 @@
 """Tests for APICallNode."""
 
+import asyncio
+from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import httpx
 import pytest
-from workflow_engine import WorkflowEngine, WorkflowExecutionResultStatus
+from workflow_engine import (
+    JSONValue,
+    ValidationContext,
+    WorkflowEngine,
+    WorkflowExecutionResultStatus,
+)
 from workflow_engine.contexts import InMemoryExecutionContext
+from workflow_engine.core import StakeholderLevel
 
-from aceteam_nodes.nodes.api_call import APICallNode
+from aceteam_nodes.nodes.api_call import _CLIENTS, APICallNode
 
 
-def _mock_httpx_client(*, capture: dict[str, str | None]) -> MagicMock:
+@pytest.fixture(autouse=True)
+def _reset_shared_clients() -> None:
+    """Drop pooled clients so each test's patched AsyncClient is picked up."""
+    _CLIENTS.clear()
+
+
+def _mock_httpx_client(
+    *,
+    capture: dict[str, str | None] | None = None,
+    status_code: int = 200,
+    json: Any = {"ok": True},
+    text: str = "",
+) -> MagicMock:
+    """A pooled-client stand-in answering every request with one JSON response.
+
+    ``json`` may be an exception, which ``response.json()`` then raises. Sent
+    arguments are in ``request.await_args``; ``capture`` also gets url/method.
+    """
     mock_client = AsyncMock()
+    # The pooled client is replaced once closed, so mocks must report open.
+    mock_client.is_closed = False
     mock_response = MagicMock()
-    mock_response.status_code = 200
+    mock_response.status_code = status_code
     mock_response.headers = {"content-type": "application/json"}
-    mock_response.json.return_value = {"ok": True}
+    if isinstance(json, BaseException):
+        mock_response.json.side_effect = json
+    else:
+        mock_response.json.return_value = json
+    mock_response.text = text
 
     async def request(**kwargs: object) -> MagicMock:
-        capture["url"] = str(kwargs.get("url"))
-        capture["method"] = str(kwargs.get("method"))
+        if capture is not None:
+            capture["url"] = str(kwargs.get("url"))
+            capture["method"] = str(kwargs.get("method"))
         return mock_response
 
-    mock_client.request = request
-    mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-    mock_client.__aexit__ = AsyncMock(return_value=None)
+    mock_client.request = AsyncMock(side_effect=request)
     return mock_client
 
 
@@ -85,6 +116,7 @@ async def test_execute_node_substitutes_input_into_body(engine: WorkflowEngine):
     }
 
     mock_client = AsyncMock()
+    mock_client.is_closed = False
     mock_response = MagicMock()
     mock_response.status_code = 201
     mock_response.headers = {"content-type": "application/json"}
@@ -96,8 +128,6 @@ async def test_execute_node_substitutes_input_into_body(engine: WorkflowEngine):
         return mock_response
 
     mock_client.request = request
-    mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-    mock_client.__aexit__ = AsyncMock(return_value=None)
 
     with patch(
         "aceteam_nodes.nodes.api_call.httpx.AsyncClient",
@@ -122,7 +152,10 @@ async def test_execute_node_substitutes_input_into_headers(engine: WorkflowEngin
     params = {
         "url": "https://api.example.com/data",
         "method": "GET",
-        "headers": {"Authorization": "Bearer {{ api_token }}"},
+        "headers": {
+            "Authorization": "Bearer {{ api_token }}",
+            "X-Client": "aceteam",
+        },
         "body_template": "",
         "parameters": {
             "api_token": {
@@ -134,6 +167,7 @@ async def test_execute_node_substitutes_input_into_headers(engine: WorkflowEngin
     }
 
     mock_client = AsyncMock()
+    mock_client.is_closed = False
     mock_response = MagicMock()
     mock_response.status_code = 200
     mock_response.headers = {"content-type": "application/json"}
@@ -144,8 +178,6 @@ async def test_execute_node_substitutes_input_into_headers(engine: WorkflowEngin
         return mock_response
 
     mock_client.request = request
-    mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-    mock_client.__aexit__ = AsyncMock(return_value=None)
 
     with patch(
         "aceteam_nodes.nodes.api_call.httpx.AsyncClient",
@@ -159,7 +191,10 @@ async def test_execute_node_substitutes_input_into_headers(engine: WorkflowEngin
         )
 
     assert result.status is WorkflowExecutionResultStatus.SUCCESS
-    assert capture["headers"] == {"Authorization": "Bearer secret-abc"}
+    assert capture["headers"] == {
+        "Authorization": "Bearer secret-abc",
+        "X-Client": "aceteam",
+    }
 
 
 @pytest.mark.asyncio
@@ -184,3 +219,323 @@ async def test_undefined_template_variable_fails(engine: WorkflowEngine):
         )
 
     assert result.status is WorkflowExecutionResultStatus.ERROR
+
+
+@pytest.mark.asyncio
+async def test_calls_on_one_event_loop_share_a_client(engine: WorkflowEngine):
+    context = InMemoryExecutionContext()
+    capture: dict[str, str | None] = {"url": None, "method": None}
+    params = {"url": "https://api.example.com/health", "method": "GET"}
+
+    with patch(
+        "aceteam_nodes.nodes.api_call.httpx.AsyncClient",
+        return_value=_mock_httpx_client(capture=capture),
+    ) as client_cls:
+        for _ in range(3):
+            result = await engine.execute_node(
+                context=context,
+                node=APICallNode,
+                params=params,
+                input={},
+            )
+            assert result.status is WorkflowExecutionResultStatus.SUCCESS
+            assert capture["url"] == "https://api.example.com/health"
+
+    client_cls.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_nodes_with_same_parameters_share_input_type():
+    parameters = {"employee_id": {"type": "string", "title": "employee_id"}}
+    nodes = [
+        APICallNode.model_validate(
+            {
+                "id": f"call_{i}",
+                "type": "APICall",
+                "params": {"url": "https://api.example.com", "parameters": parameters},
+            }
+        )
+        for i in range(2)
+    ]
+    context = ValidationContext()
+    first, second = [await node.input_type(context) for node in nodes]
+    assert first is second
+    assert set(first.model_fields) == {"employee_id"}
+
+
+@pytest.mark.asyncio
+async def test_template_syntax_error_fails(engine: WorkflowEngine):
+    context = InMemoryExecutionContext()
+    params = {
+        "url": "https://api.example.com/users/{{ employee_id",
+        "method": "GET",
+    }
+
+    with patch("aceteam_nodes.nodes.api_call.httpx.AsyncClient"):
+        result = await engine.execute_node(
+            context=context,
+            node=APICallNode,
+            params=params,
+            input={},
+        )
+
+    assert result.status is WorkflowExecutionResultStatus.ERROR
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("configured", "expected"),
+    [
+        ({}, {"Content-Type": "application/json"}),
+        ({"content-type": "application/vnd.api+json"}, None),
+    ],
+)
+async def test_json_body_content_type(
+    engine: WorkflowEngine,
+    configured: dict[str, str],
+    expected: dict[str, str] | None,
+):
+    context = InMemoryExecutionContext()
+    params = {
+        "url": "https://api.example.com/users",
+        "method": "POST",
+        "headers": configured,
+        "body_template": '{"name": "Ada"}',
+    }
+    mock_client = _mock_httpx_client(status_code=201, json={"created": True})
+
+    with patch(
+        "aceteam_nodes.nodes.api_call.httpx.AsyncClient",
+        return_value=mock_client,
+    ):
+        result = await engine.execute_node(
+            context=context,
+            node=APICallNode,
+            params=params,
+            input={},
+        )
+
+    assert result.status is WorkflowExecutionResultStatus.SUCCESS
+    sent = mock_client.request.await_args.kwargs
+    assert sent["headers"] == (configured if expected is None else expected)
+
+
+@pytest.mark.asyncio
+async def test_invalid_json_response_falls_back_to_text(engine: WorkflowEngine):
+    context = InMemoryExecutionContext()
+    params = {"url": "https://api.example.com/health", "method": "GET"}
+
+    mock_client = _mock_httpx_client(
+        status_code=502,
+        json=ValueError("Expecting value"),
+        text="<html>Bad Gateway</html>",
+    )
+
+    with patch(
+        "aceteam_nodes.nodes.api_call.httpx.AsyncClient",
+        return_value=mock_client,
+    ):
+        result = await engine.execute_node(
+            context=context,
+            node=APICallNode,
+            params=params,
+            input={},
+        )
+
+    assert result.status is WorkflowExecutionResultStatus.SUCCESS
+    assert result.output is not None
+    assert result.output["response"].root == "<html>Bad Gateway</html>"
+
+
+@pytest.mark.asyncio
+async def test_deeply_nested_json_response_falls_back_to_text(
+    engine: WorkflowEngine,
+):
+    context = InMemoryExecutionContext()
+    body = b"[" * 100_000
+    # A real response, so the RecursionError comes from httpx's own decoding.
+    mock_client = _mock_httpx_client()
+    mock_client.request = AsyncMock(
+        return_value=httpx.Response(
+            200, headers={"content-type": "application/json"}, content=body
+        )
+    )
+
+    with patch(
+        "aceteam_nodes.nodes.api_call.httpx.AsyncClient",
+        return_value=mock_client,
+    ):
+        result = await engine.execute_node(
+            context=context,
+            node=APICallNode,
+            params={"url": "https://api.example.com/health", "method": "GET"},
+            input={},
+        )
+
+    assert result.status is WorkflowExecutionResultStatus.SUCCESS
+    assert result.output is not None
+    assert result.output["response"].root == body.decode()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("body_template", "expected"),
+    [
+        ("", {"headers": {}}),
+        (
+            '{"name": "Ada"}\n',
+            {
+                "headers": {"Content-Type": "application/json"},
+                "content": b'{"name":"Ada"}',
+            },
+        ),
+        ("plain text", {"headers": {}, "content": "plain text"}),
+        (
+            '{"name": "{{ name }}"}',
+            {"headers": {"Content-Type": "application/json"}, "json": {"name": "Ada"}},
+        ),
+    ],
+)
+async def test_request_body_is_sent(
+    engine: WorkflowEngine,
+    body_template: str,
+    expected: dict[str, object],
+):
+    """Static bodies are sent pre-encoded; templated ones are rendered per run."""
+    context = InMemoryExecutionContext()
+    params = {
+        "url": "https://api.example.com/users",
+        "method": "POST",
+        "body_template": body_template,
+        "parameters": {"name": {"type": "string", "title": "name"}},
+    }
+    mock_client = _mock_httpx_client(status_code=201, json={"created": True})
+
+    with patch(
+        "aceteam_nodes.nodes.api_call.httpx.AsyncClient",
+        return_value=mock_client,
+    ):
+        result = await engine.execute_node(
+            context=context,
+            node=APICallNode,
+            params=params,
+            input={"name": "Ada"},
+        )
+
+    assert result.status is WorkflowExecutionResultStatus.SUCCESS
+    sent = mock_client.request.await_args.kwargs
+    assert {
+        key: sent[key] for key in ("headers", "content", "json") if key in sent
+    } == expected
+
+
+@pytest.mark.asyncio
+async def test_shared_client_does_not_replay_cookies(engine: WorkflowEngine):
+    context = InMemoryExecutionContext()
+    sent_cookies: list[str | None] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent_cookies.append(request.headers.get("cookie"))
+        return httpx.Response(
+            200,
+            json={"ok": True},
+            headers={"set-cookie": "session=alice-secret; Path=/"},
+        )
+
+    real_client = httpx.AsyncClient
+
+    def client_with_mock_transport(**kwargs: Any) -> httpx.AsyncClient:
+        return real_client(transport=httpx.MockTransport(handler), **kwargs)
+
+    with patch(
+        "aceteam_nodes.nodes.api_call.httpx.AsyncClient",
+        side_effect=client_with_mock_transport,
+    ):
+        for url in ("https://api.example.com/login", "https://api.example.com/me"):
+            result = await engine.execute_node(
+                context=context,
+                node=APICallNode,
+                params={"url": url, "method": "GET"},
+                input={},
+            )
+            assert result.status is WorkflowExecutionResultStatus.SUCCESS
+
+    assert sent_cookies == [None, None]
+
+
+def test_shared_client_is_closed_with_its_event_loop(engine: WorkflowEngine):
+    """Hosts that start a loop per workflow must not leak a client per loop."""
+    clients: list[httpx.AsyncClient] = []
+    real_client = httpx.AsyncClient
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"ok": True})
+
+    def client_with_mock_transport(**kwargs: Any) -> httpx.AsyncClient:
+        client = real_client(transport=httpx.MockTransport(handler), **kwargs)
+        clients.append(client)
+        return client
+
+    async def call() -> None:
+        result = await engine.execute_node(
+            context=InMemoryExecutionContext(),
+            node=APICallNode,
+            params={"url": "https://api.example.com/health", "method": "GET"},
+            input={},
+        )
+        assert result.status is WorkflowExecutionResultStatus.SUCCESS
+
+    with patch(
+        "aceteam_nodes.nodes.api_call.httpx.AsyncClient",
+        side_effect=client_with_mock_transport,
+    ):
+        for _ in range(3):
+            asyncio.run(call())
+
+    assert len(clients) == 3
+    assert all(client.is_closed for client in clients)
+    assert not _CLIENTS
+
+
+@pytest.mark.asyncio
+async def test_json_response_is_validated(engine: WorkflowEngine):
+    """Floats in a response become Decimal, as the engine's JSON type requires."""
+    context = InMemoryExecutionContext()
+    mock_client = _mock_httpx_client(json={"price": 19.99})
+
+    with patch(
+        "aceteam_nodes.nodes.api_call.httpx.AsyncClient",
+        return_value=mock_client,
+    ):
+        result = await engine.execute_node(
+            context=context,
+            node=APICallNode,
+            params={"url": "https://api.example.com/item", "method": "GET"},
+            input={},
+        )
+
+    assert result.status is WorkflowExecutionResultStatus.SUCCESS
+    assert result.output is not None
+    assert result.output["response"] == JSONValue({"price": 19.99})
+
+
+@pytest.mark.asyncio
+async def test_non_json_compliant_static_body_is_user_error(engine: WorkflowEngine):
+    context = InMemoryExecutionContext()
+    params = {
+        "url": "https://api.example.com/users",
+        "method": "POST",
+        "body_template": '{"x": NaN}',
+    }
+
+    with patch("aceteam_nodes.nodes.api_call.httpx.AsyncClient"):
+        result = await engine.execute_node(
+            context=context,
+            node=APICallNode,
+            params=params,
+            input={},
+        )
+
+    assert result.status is WorkflowExecutionResultStatus.ERROR
+    [errors] = result.errors.node_errors.values()
+    assert [error and error.level for error in errors] == [StakeholderLevel.USER]
@@ -30,3 +30,24 @@ def test_cli_context_verbose_flag():
 
     ctx = CLIContext(config_path="/nonexistent/config.yaml", verbose=False)
     assert ctx.verbose is False
+
+
+def test_cli_context_reloads_config_after_edit():
+    with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
+        yaml.dump({"default_model": "gpt-4o-mini", "keys": {"openai": "sk"}}, f)
+    try:
+        first = CLIContext(config_path=f.name)
+        first.config["default_model"] = "mutated"
+        first.config["keys"]["openai"] = "mutated"
+        second = CLIContext(config_path=f.name)
+        assert second.config["default_model"] == "gpt-4o-mini"
+        assert second.config["keys"] == {"openai": "sk"}
+
+        with open(f.name, "w") as out:
+            yaml.dump({"default_model": "claude-3-5-sonnet-latest"}, out)
+        stat = os.stat(f.name)
+        os.utime(f.name, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        ctx = CLIContext(config_path=f.name)
+        assert ctx.config["default_model"] == "claude-3-5-sonnet-latest"
+    finally:
+        os.unlink(f.name)
@@ -0,0 +1,29 @@
+"""Tests that chat subpackages import only the node module that is used."""
+
+import subprocess
+import sys
+
+import pytest
+
+NODE_MODULES = {
+    "slack": ("list_channels", "read_messages", "search_messages", "send"),
+    "discord": ("bot_info", "list_channels", "read_messages", "send"),
+    "telegram": ("bot_info", "list_chats", "read_messages", "send"),
+}
+
+
+@pytest.mark.parametrize("package", sorted(NODE_MODULES))
+def test_leaf_import_skips_sibling_nodes(package: str):
+    prefix = f"aceteam_nodes.nodes.{package}"
+    siblings = [f"{prefix}.{name}" for name in NODE_MODULES[package] if name != "send"]
+    # A fresh interpreter, since conftest already imports every node.
+    code = (
+        "import sys\n"
+        f"import {prefix}.send\n"
+        f"loaded = [name for name in {siblings!r} if name in sys.modules]\n"
+        "assert not loaded, loaded\n"
+        # Every public name still resolves on first access.
+        f"import {prefix} as package\n"
+        "[getattr(package, name) for name in package.__all__]\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
@@ -0,0 +1,51 @@
+"""Tests for the string and template helpers."""
+
+import pytest
+from jinja2 import Environment, StrictUndefined
+
+from aceteam_nodes.utils import format_jinja, format_string
+
+
+@pytest.mark.parametrize(
+    ("template", "variables"),
+    [
+        ("a\r\nb", {}),
+        ("a\n\n", {}),
+        ("a }} b", {}),
+        ("plain text", {}),
+        ("Hello {{ name }}!\n", {"name": "<world>"}),
+    ],
+)
+@pytest.mark.parametrize("auto_escape", [True, False])
+def test_format_jinja_matches_jinja(
+    template: str, variables: dict[str, str], auto_escape: bool
+):
+    environment = Environment(autoescape=auto_escape, undefined=StrictUndefined)
+    expected = environment.from_string(template).render(**variables)
+    assert format_jinja(template, variables, auto_escape=auto_escape) == expected
+
+
+def test_format_string_substitutes_every_key():
+    assert format_string("{a} and {b}", {"a": "1", "b": "2"}) == "1 and 2"
+
+
+def test_format_string_without_braces_is_unchanged():
+    assert format_string("no placeholders", {"a": "1"}) == "no placeholders"
+
+
+def test_format_string_leaves_unknown_placeholders():
+    assert format_string("{a} {c}", {"a": "1"}) == "1 {c}"
+
+
+def test_format_string_iterations():
+    variables = {"a": "{b}", "b": "done"}
+    assert format_string("{a}", variables) == "{b}"
+    assert format_string("{a}", variables, iterations=2) == "done"
+    assert format_string("{a}", variables, iterations=5) == "done"
+
+
+def test_format_string_rejects_braced_keys_every_call():
+    # The key check is cached per key set; repeat calls must still fail.
+    for _ in range(2):
+        with pytest.raises(AssertionError):
+            format_string("{a}", {"{a}": "1"})